@@ -9,7 +9,10 @@ from chromosome import initialize_population
 from crossover import single_point_crossover, uniform_crossover
 from mutation import scramble_mutation
 from elitism import apply_elitism
+from diversity import population_diversity, chromosome_key, deduplicate_offspring
+from results_store import ResultsStore
 from tabu_search import tabu_search
+from parallel_tabu import parallel_tabu_search
 
 # Check if 'FitnessMin' is already defined before creating it
 if not hasattr(creator, "FitnessMin"):
@@ -59,6 +62,56 @@ def evaluate(individual, jobs_data):
 
     return current_time, task_schedule
 
+# Marker returned by evaluate_bounded when a schedule cannot beat the cut-off
+CUTOFF_EXCEEDED = float('inf')
+
+def remaining_work(jobs_data):
+    """
+    Total processing time per job and per machine, used as lower bounds by evaluate_bounded.
+    Compute once per dataset and pass it to every bounded evaluation.
+    """
+    job_work = [sum(duration for _, duration in job) for job in jobs_data]
+    machine_work = {}
+    for job in jobs_data:
+        for machine, duration in job:
+            machine_work[machine] = machine_work.get(machine, 0) + duration
+    return job_work, machine_work
+
+# Fitness evaluation with early cut-off against an incumbent makespan
+def evaluate_bounded(individual, jobs_data, cutoff, bounds=None):
+    """
+    Decode an individual like `evaluate`, but stop as soon as the makespan is
+    certain to exceed `cutoff`: after every operation, the end time of its job
+    or machine plus the work still left on that job or machine is a lower bound.
+
+    Returns (makespan, task_schedule), or (CUTOFF_EXCEEDED, None) when aborted.
+    """
+    job_remaining, machine_remaining = bounds if bounds is not None else remaining_work(jobs_data)
+    job_remaining = list(job_remaining)
+    machine_remaining = dict(machine_remaining)
+
+    job_end_times = {job_id: 0 for job_id in range(len(jobs_data))}
+    machine_end_times = {}
+    task_schedule = []
+    current_time = 0
+
+    for job_id, task_id in individual:
+        machine, duration = jobs_data[job_id][task_id]
+        start_time = max(job_end_times[job_id], machine_end_times.get(machine, 0))
+        end_time = start_time + duration
+        job_remaining[job_id] -= duration
+        machine_remaining[machine] -= duration
+
+        if end_time + job_remaining[job_id] > cutoff or end_time + machine_remaining[machine] > cutoff:
+            return CUTOFF_EXCEEDED, None
+
+        job_end_times[job_id] = end_time
+        machine_end_times[machine] = end_time
+        task_schedule.append((job_id, task_id, machine, start_time, end_time))
+        current_time = max(current_time, end_time)
+
+    return current_time, task_schedule
+
 # Define Gantt Chart plotting function
 def plot_gantt_chart(task_schedule, num_machines):
     """
@@ -83,7 +136,41 @@ def plot_gantt_chart(task_schedule, num_machines):
     plt.show()
 
 # Run GA with specific parameters
-def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
+def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1, controller=None,
+           cutoff_evaluation=False, plot=True, evaluator=None,
+           seed_fraction=0.0, interleaved_init=False, deduplicate=False, tabu_starts=1, tabu_processes=None):
+    """
+    Run the GA on a dataset file.
+
+    If an `AdaptiveOperatorController` is passed as `controller`, it chooses the
+    crossover operator for every mating and sets the mutation probability from
+    population diversity each generation; its statistics remain available to
+    the caller through `controller.statistics()` after the run. Unless the
+    controller was given its own `base_mutpb`, `mutpb` is its base mutation rate.
+
+    With `cutoff_evaluation`, offspring are decoded with `evaluate_bounded`
+    against the worst makespan of the current population; offspring that
+    cannot beat it are abandoned after a partial decode and their slot keeps
+    the individual selected for it.
+    The same flag enables bounded evaluation of neighbors in the Tabu Search.
+
+    Set `plot=False` to skip the Gantt chart, e.g. when many runs are batched.
+
+    An `evaluator` such as `parallel_eval.SharedMemoryEvaluator` evaluates the
+    offspring of every generation in parallel; the caller owns and closes it.
+
+    `seed_fraction` of the initial population is built with dispatching rules
+    (SPT, LPT, MWKR, MOR, random); `interleaved_init` fills the rest with
+    interleaved random operation orders instead of shuffled whole jobs.
+
+    With `deduplicate`, offspring that duplicate an elite or another offspring are
+    replaced by fresh or heavily mutated individuals before evaluation.
+
+    With `tabu_starts` > 1, the refinement runs `parallel_tabu_search` from the
+    `tabu_starts` best distinct individuals of the final population on
+    `tabu_processes` workers. This multi-start path evaluates neighborhoods in
+    full batches and ignores `cutoff_evaluation`.
+    """
     # Parse dataset
     num_jobs, num_machines, jobs_data = parse_dataset(file_path)
 
@@ -91,7 +178,9 @@ def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
     tasks = [(job_id, task_id) for job_id, job in enumerate(jobs_data) for task_id in range(len(job))]
 
     # Initialize population
-    population = initialize_population(population_size, tasks, lambda ind: evaluate(ind, jobs_data))
+    population = initialize_population(population_size, tasks, lambda ind: evaluate(ind, jobs_data),
+                                       jobs_data=jobs_data, seed_fraction=seed_fraction,
+                                       interleaved=interleaved_init)
 
 
     # Initialize DEAP toolbox
@@ -99,15 +188,21 @@ def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
     toolbox.register("individual", tools.initIterate, creator.Individual, lambda: random.choice(population))
     toolbox.register("population", tools.initRepeat, list, toolbox.individual)
     toolbox.register("evaluate", lambda ind: evaluate(ind, jobs_data)[0])  # Fitness function
+    bounds = remaining_work(jobs_data)
+    toolbox.register("evaluate_bounded", lambda ind, cutoff: evaluate_bounded(ind, jobs_data, cutoff, bounds)[0])
     toolbox.register("mate", random.choice([single_point_crossover, uniform_crossover]))
     toolbox.register("mutate", lambda ind: scramble_mutation(ind, jobs_data))
     toolbox.register("select", tools.selTournament, tournsize=3)
 
+    if controller is not None:
+        controller.set_default_mutation_rate(mutpb)
+
     fitness_evolution = []
 
     # Main GA loop
     for gen in range(ngen):
-        print(f"Generation {gen+1}/{ngen}")
+        diversity = population_diversity(population)
+        print(f"Generation {gen+1}/{ngen} - Diversity: {diversity:.2f}")
 
         # Apply elitism
         elites = apply_elitism(population, elitism_size)
@@ -117,28 +212,70 @@ def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
 
 
         # Select offspring and clone
-        offspring = toolbox.select(population, len(population) - elitism_size)
-        offspring = list(map(toolbox.clone, offspring))
+        selected = toolbox.select(population, len(population) - elitism_size)
+        offspring = list(map(toolbox.clone, selected))
+
+        # Offspring worse than the current worst individual are cut off early
+        cutoff = max(ind.fitness.values[0] for ind in population)
+
+        # Adapt mutation probability to the current population diversity
+        if controller is not None:
+            mutation_rate = controller.update_mutation_rate(diversity)
+        else:
+            mutation_rate = mutpb
 
         # Apply crossover
+        credits = []  # (operator, best parent makespan, child1, child2) for the controller
         for child1, child2 in zip(offspring[::2], offspring[1::2]):
             if random.random() < cxpb:
-                toolbox.mate(child1, child2)
+                if controller is not None:
+                    operator = controller.select_operator()
+                    parent_fitness = min(child1.fitness.values[0], child2.fitness.values[0])
+                    child1[:], child2[:] = controller.operators[operator](child1, child2)
+                    credits.append((operator, parent_fitness, child1, child2))
+                else:
+                    child1[:], child2[:] = toolbox.mate(child1, child2)
                 del child1.fitness.values
                 del child2.fitness.values
 
         # Apply mutation
         for mutant in offspring:
-            if random.random() < mutpb:
+            if random.random() < mutation_rate:
                 toolbox.mutate(mutant)
                 del mutant.fitness.values
 
+        # Replace duplicate offspring to keep the population diverse
+        if deduplicate:
+            replaced = deduplicate_offspring(offspring, [chromosome_key(ind) for ind in elites], tasks)
+            # Replacements are random restarts, not the outcome of the crossover that made the duplicate
+            replaced_ids = {id(ind) for ind in replaced}
+            credits = [credit for credit in credits
+                       if id(credit[2]) not in replaced_ids and id(credit[3]) not in replaced_ids]
+
         # Evaluate invalid individuals
         invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = map(toolbox.evaluate, invalid_ind)
+        if evaluator is not None:
+            fitnesses = evaluator.evaluate(invalid_ind, cutoff if cutoff_evaluation else None)
+        elif cutoff_evaluation:
+            fitnesses = [toolbox.evaluate_bounded(ind, cutoff) for ind in invalid_ind]
+        else:
+            fitnesses = map(toolbox.evaluate, invalid_ind)
         for ind, fit in zip(invalid_ind, fitnesses):
             ind.fitness.values = (fit,)
 
+        # Credit crossover operators with the outcome of their children
+        for operator, parent_fitness, child1, child2 in credits:
+            controller.record(operator, parent_fitness, child1.fitness.values[0])
+            controller.record(operator, parent_fitness, child2.fitness.values[0])
+        if controller is not None:
+            controller.end_generation()
+
+        # A cut-off child is rejected: its slot keeps the individual selected for it,
+        # so no CUTOFF_EXCEEDED fitness ever enters the population
+        if cutoff_evaluation:
+            offspring = [toolbox.clone(parent) if child.fitness.values[0] == CUTOFF_EXCEEDED else child
+                         for parent, child in zip(selected, offspring)]
+
         # Replace population with elites and offspring
         population[:] = elites + offspring
 
@@ -170,7 +307,8 @@ def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
             print(f"✅ Job {job_id} task order is correct: {sorted_task_ids}")
 
     # Add Gantt Chart Visualization for this experiment
-    plot_gantt_chart(best_task_schedule, num_machines)
+    if plot:
+        plot_gantt_chart(best_task_schedule, num_machines)
 
     # Now applying Tabu Search to refine the best solution
     print("Applying Tabu Search to refine the solution...")
@@ -178,8 +316,22 @@ def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
     # Extract only job-task pairs from the best solution
     best_solution_tabu = [(job_id, task_id) for job_id, task_id, _, _, _ in best_task_schedule]
 
-    # Run Tabu Search with a deepcopy of best_solution_tabu
-    refined_solution, refined_makespan = tabu_search(best_solution_tabu, jobs_data, evaluate)
+    if tabu_starts > 1:
+        # Multi-start Tabu Search from distinct elites (the population holds elite copies
+        # and tournament clones), evaluated in parallel
+        start_solutions = [best_solution_tabu]
+        seen = {chromosome_key(best_solution_tabu)}
+        for ind in tools.selBest(population, len(population)):
+            if len(start_solutions) >= tabu_starts:
+                break
+            if chromosome_key(ind) not in seen:
+                seen.add(chromosome_key(ind))
+                start_solutions.append(list(ind))
+        refined_solution, refined_makespan = parallel_tabu_search(start_solutions, jobs_data, processes=tabu_processes)
+    else:
+        # Run Tabu Search with a deepcopy of best_solution_tabu
+        refined_solution, refined_makespan = tabu_search(best_solution_tabu, jobs_data, evaluate,
+                                                         cutoff_evaluation=cutoff_evaluation)
 
     # Re-evaluate refined solution
     _, refined_task_schedule = evaluate(refined_solution, jobs_data)
@@ -188,7 +340,8 @@ def run_ga(file_path, population_size, cxpb, mutpb, ngen, elitism_size=1):
 
     # Plot Gantt chart for Tabu Search refined solution
     print("Plotting refined schedule (Tabu Search)...")
-    plot_gantt_chart(refined_task_schedule, num_machines)
+    if plot:
+        plot_gantt_chart(refined_task_schedule, num_machines)
 
     return fitness_evolution, refined_makespan, refined_task_schedule
 
@@ -242,9 +395,16 @@ def main():
     results = []
     all_fitness_evolution = []  # Store fitness evolution data for all experiments
 
+    # Append-only results store, written as soon as each experiment finishes
+    results_folder = r"C:\Users\Arif Bhuiyan\Desktop\A2\Result"
+    os.makedirs(results_folder, exist_ok=True)
+    store = ResultsStore(os.path.join(results_folder, "experiment_results.sqlite"))
+
     # Run each experiment
     for i, param in enumerate(parameters):
         print(f"Running Experiment {i+1} with parameters: {param}")
+        seed = random.randrange(2**32)  # Recorded so the run can be reproduced
+        random.seed(seed)
         start_time = time.time()
         fitness_evolution, makespan, best_task_schedule = run_ga(file_path, **param)
         runtime = time.time() - start_time
@@ -252,9 +412,13 @@ def main():
         # Store results
         results.append([param["population_size"], param["cxpb"], param["mutpb"], param["ngen"], makespan, runtime])
         all_fitness_evolution.append(fitness_evolution)
+        store.record_experiment(dataset_name, param, makespan, runtime, fitness_evolution, best_task_schedule,
+                                seed=seed, algorithm="GA+Tabu")
 
         print(f"Experiment {i+1}: Makespan = {makespan}, Runtime = {runtime:.2f} seconds")
 
+    store.close()
+
     # Save results to CSV
     save_results_to_csv(results)
 
@@ -0,0 +1,166 @@
+import math
+import random
+from collections import deque
+
+class AdaptiveOperatorController:
+    """
+    Adaptive pursuit controller for crossover selection and mutation rate.
+
+    Each crossover operator keeps a quality estimate of how often its offspring
+    improve on their parents. Outcomes are collected over a generation with
+    `record` and applied once by `end_generation`: the quality is the operator's
+    success rate over the last `window` generations, shrunk towards the pooled
+    success rate of all operators so a rarely applied operator cannot win on a
+    single lucky child. The selection probabilities are then pulled towards the
+    best operator (adaptive pursuit), while every operator keeps at least `p_min`
+    so a stalled one can recover.
+    The mutation probability is raised as population diversity falls.
+
+    Parameters:
+    - operators (dict): Operator name -> crossover function (parent1, parent2) -> (child1, child2).
+    - base_mutpb (float): Mutation probability used while the population is fully diverse.
+      Left as None, it is taken from run_ga's `mutpb` (see `set_default_mutation_rate`).
+    - max_mutpb (float): Mutation probability used once the population has collapsed.
+    - p_min (float): Minimum selection probability of any operator.
+    - beta (float): Pursuit rate of the selection probabilities (per generation).
+    - window (int): Number of recent generations the success rates are computed over.
+    - prior_weight (float): Pseudo-applications at the pooled success rate added to each operator.
+    - min_successes (int): Successes needed in the window before the probabilities move.
+    - switch_margin (float): Relative quality margin a challenger needs to replace the current leader.
+    """
+
+    def __init__(self, operators, base_mutpb=None, max_mutpb=0.5, p_min=0.1, beta=0.3, window=20,
+                 prior_weight=10, min_successes=5,
+                 switch_margin=0.1):
+        if not operators:
+            raise ValueError("At least one operator is required.")
+        if p_min * len(operators) > 1:
+            raise ValueError("p_min is too large for the number of operators.")
+
+        self.operators = dict(operators)
+        self.base_mutpb = base_mutpb
+        self.max_mutpb = max_mutpb
+        self.mutpb = base_mutpb
+        self.p_min = p_min
+        self.p_max = 1 - (len(self.operators) - 1) * p_min
+        self.beta = beta
+        self.prior_weight = prior_weight
+        self.min_successes = min_successes
+        self.switch_margin = switch_margin
+        self.leader = None
+
+        self.probabilities = {name: 1 / len(self.operators) for name in self.operators}
+        self.quality = {name: 0.0 for name in self.operators}
+        self.applications = {name: 0 for name in self.operators}
+        self.successes = {name: 0 for name in self.operators}
+        self.generation_outcomes = {name: [0, 0] for name in self.operators}  # [applications, successes]
+        self.recent_outcomes = deque(maxlen=window)
+        self.mutpb_history = []
+
+    def select_operator(self):
+        """
+        Draw an operator name according to the current selection probabilities.
+        """
+        names = list(self.probabilities)
+        weights = [self.probabilities[name] for name in names]
+        return random.choices(names, weights=weights)[0]
+
+    def record(self, name, parent_fitness, child_fitness):
+        """
+        Credit operator `name` with the outcome of one child; it is applied to the
+        quality estimate at the next `end_generation`.
+        Both fitness values are makespans (lower is better). A child cut off by
+        bounded evaluation (CUTOFF_EXCEEDED) counts as a failure; a non-finite
+        parent gives nothing to compare against, so that outcome is ignored.
+        """
+        if not math.isfinite(parent_fitness):
+            return
+
+        self.applications[name] += 1
+        self.generation_outcomes[name][0] += 1
+        if child_fitness < parent_fitness:
+            self.successes[name] += 1
+            self.generation_outcomes[name][1] += 1
+
+    def end_generation(self):
+        """
+        Close the generation: update the windowed quality estimates and take
+        one pursuit step on the selection probabilities.
+        """
+        self.recent_outcomes.append({name: tuple(counts) for name, counts in self.generation_outcomes.items()})
+        self.generation_outcomes = {name: [0, 0] for name in self.operators}
+
+        totals = {name: [0, 0] for name in self.operators}
+        for outcomes in self.recent_outcomes:
+            for name, (applications, successes) in outcomes.items():
+                totals[name][0] += applications
+                totals[name][1] += successes
+
+        pooled_applications = sum(applications for applications, _ in totals.values())
+        pooled_successes = sum(successes for _, successes in totals.values())
+        if not pooled_applications:
+            return
+        pooled_rate = pooled_successes / pooled_applications
+
+        for name, (applications, successes) in totals.items():
+            self.quality[name] = ((successes + self.prior_weight * pooled_rate)
+                                  / (applications + self.prior_weight))
+
+        # Too few successes in the window to tell the operators apart
+        if pooled_successes >= self.min_successes:
+            self._pursue()
+
+    def _pursue(self):
+        best_quality = max(self.quality.values())
+        challengers = [name for name, quality in self.quality.items() if quality == best_quality]
+
+        # A challenger replaces the leader only with a clear margin (hysteresis against noise)
+        if self.leader is None or self.leader not in challengers:
+            leader_quality = self.quality[self.leader] if self.leader is not None else 0.0
+            if len(challengers) == 1 and best_quality > leader_quality * (1 + self.switch_margin):
+                self.leader = challengers[0]
+        if self.leader is None:
+            return
+
+        # Move the leader towards p_max and all others towards p_min
+        for name in self.probabilities:
+            target = self.p_max if name == self.leader else self.p_min
+            self.probabilities[name] += self.beta * (target - self.probabilities[name])
+
+    def set_default_mutation_rate(self, mutpb):
+        """
+        Use `mutpb` as the base mutation probability unless one was given explicitly.
+        """
+        if self.base_mutpb is None:
+            self.base_mutpb = mutpb
+            self.mutpb = mutpb
+
+    def update_mutation_rate(self, diversity):
+        """
+        Interpolate the mutation probability between `base_mutpb` and `max_mutpb`
+        as diversity (in [0, 1]) falls. Returns the new mutation probability.
+        """
+        if self.base_mutpb is None:
+            raise ValueError("base_mutpb is not set; pass it or call set_default_mutation_rate().")
+        diversity = min(max(diversity, 0.0), 1.0)
+        max_mutpb = max(self.base_mutpb, self.max_mutpb)
+        self.mutpb = self.base_mutpb + (max_mutpb - self.base_mutpb) * (1 - diversity)
+        self.mutpb_history.append(self.mutpb)
+        return self.mutpb
+
+    def statistics(self):
+        """
+        Per-operator statistics: applications, successes, success rate,
+        quality estimate and current selection probability.
+        """
+        stats = {}
+        for name in self.operators:
+            applications = self.applications[name]
+            stats[name] = {
+                "applications": applications,
+                "successes": self.successes[name],
+                "success_rate": self.successes[name] / applications if applications else 0.0,
+                "quality": self.quality[name],
+                "probability": self.probabilities[name],
+            }
+        return stats
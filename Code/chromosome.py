@@ -24,13 +24,111 @@ def create_chromosome(tasks):
 
     return chromosome
 
-def initialize_population(population_size, tasks, evaluate):
+def build_chromosome(job_sequence):
+    """
+    Build a chromosome from a sequence of job ids.
+    The k-th occurrence of a job becomes its k-th task, so task precedence always holds.
+    """
+    next_task = {}
+    chromosome = []
+    for job_id in job_sequence:
+        task_id = next_task.get(job_id, 0)
+        chromosome.append((job_id, task_id))
+        next_task[job_id] = task_id + 1
+    return chromosome
+
+# Priority rules for dispatching seeds
+DISPATCH_RULES = ("SPT", "LPT", "MWKR", "MOR", "RANDOM")
+
+def create_interleaved_chromosome(tasks):
+    """
+    Create a chromosome with a random interleaving of all operations.
+    Job ids are shuffled as a multiset and task ids reassigned in order, so
+    task precedence within each job is maintained.
+    """
+    job_sequence = [job_id for job_id, _ in tasks]
+    random.shuffle(job_sequence)
+    return build_chromosome(job_sequence)
+
+def create_dispatch_chromosome(jobs_data, rule, noise=0.0):
+    """
+    Create a chromosome with a non-delay dispatching heuristic.
+
+    At every step, the next operations that can start earliest are the candidates
+    and `rule` picks one of them:
+    - SPT: shortest processing time
+    - LPT: longest processing time
+    - MWKR: most work remaining in the job
+    - MOR: most operations remaining in the job
+    - RANDOM: uniformly at random
+    With probability `noise` a random candidate is taken instead (randomized
+    dispatching); ties are always broken at random.
+    """
+    if rule not in DISPATCH_RULES:
+        raise ValueError(f"Unknown dispatching rule: {rule}")
+
+    num_jobs = len(jobs_data)
+    next_task = [0] * num_jobs
+    job_end_times = [0] * num_jobs
+    machine_end_times = {}
+    work_remaining = [sum(duration for _, duration in job) for job in jobs_data]
+
+    priorities = {
+        "SPT": lambda job_id: jobs_data[job_id][next_task[job_id]][1],
+        "LPT": lambda job_id: -jobs_data[job_id][next_task[job_id]][1],
+        "MWKR": lambda job_id: -work_remaining[job_id],
+        "MOR": lambda job_id: -(len(jobs_data[job_id]) - next_task[job_id]),
+    }
+
+    chromosome = []
+    for _ in range(sum(len(job) for job in jobs_data)):
+        start_times = {}
+        for job_id in range(num_jobs):
+            if next_task[job_id] < len(jobs_data[job_id]):
+                machine, _ = jobs_data[job_id][next_task[job_id]]
+                start_times[job_id] = max(job_end_times[job_id], machine_end_times.get(machine, 0))
+
+        earliest = min(start_times.values())
+        candidates = [job_id for job_id, start in start_times.items() if start == earliest]
+
+        if rule == "RANDOM" or random.random() < noise:
+            job_id = random.choice(candidates)
+        else:
+            job_id = min(candidates, key=lambda job: (priorities[rule](job), random.random()))
+
+        task_id = next_task[job_id]
+        machine, duration = jobs_data[job_id][task_id]
+        job_end_times[job_id] = machine_end_times[machine] = earliest + duration
+        work_remaining[job_id] -= duration
+        next_task[job_id] += 1
+        chromosome.append((job_id, task_id))
+
+    return chromosome
+
+def initialize_population(population_size, tasks, evaluate, jobs_data=None, seed_fraction=0.0,
+                          rules=DISPATCH_RULES, interleaved=False):
     """
     Initialize a population while ensuring task precedence is maintained.
+
+    A `seed_fraction` of the population (requires `jobs_data`) is built with the
+    dispatching `rules` in turn; the first seed of each rule is deterministic up
+    to ties, later ones use randomized dispatching. The rest of the population
+    is random: whole shuffled jobs by default, or interleaved operation orders
+    with `interleaved=True`.
     """
+    num_seeds = int(round(population_size * seed_fraction))
+    if num_seeds and jobs_data is None:
+        raise ValueError("jobs_data is required to seed the population with dispatching rules.")
+
     population = []
-    for _ in range(population_size):
-        chromosome = create_chromosome(tasks)  # Uses updated function
+    for i in range(population_size):
+        if i < num_seeds:
+            rule = rules[i % len(rules)]
+            chromosome = create_dispatch_chromosome(jobs_data, rule, noise=0.0 if i < len(rules) else 0.2)
+        elif interleaved:
+            chromosome = create_interleaved_chromosome(tasks)
+        else:
+            chromosome = create_chromosome(tasks)  # Uses updated function
         individual = creator.Individual(chromosome)
         
         # Evaluate the fitness of the individual
@@ -1,4 +1,5 @@
 import random
+from chromosome import build_chromosome
 
 def single_point_crossover(parent1, parent2):
     """
@@ -21,25 +22,28 @@ def single_point_crossover(parent1, parent2):
 def repair_chromosome(child, parent):
     """
     Repair a child chromosome by ensuring that task precedence is maintained.
+    Surplus operations of a job are dropped, missing ones are appended in the
+    parent's order, and task ids are reassigned in order of appearance so the
+    child always contains every operation exactly once.
     """
-    job_task_order = {}
+    # Count the operations of each job from the parent (correct order reference)
+    remaining = {}
+    for job_id, _ in parent:
+        remaining[job_id] = remaining.get(job_id, 0) + 1
 
-    # Build job task precedence order from the parent (correct order reference)
-    for job_id, task_id in parent:
-        if job_id not in job_task_order:
-            job_task_order[job_id] = []
-        job_task_order[job_id].append(task_id)
+    job_sequence = []
+    for job_id, _ in child:
+        if remaining.get(job_id, 0) > 0:
+            job_sequence.append(job_id)
+            remaining[job_id] -= 1
 
-    # Ensure tasks appear in the correct order
-    seen_tasks = {job_id: [] for job_id in job_task_order}
-    fixed_child = []
+    # Append operations lost during crossover
+    for job_id, _ in parent:
+        if remaining[job_id] > 0:
+            job_sequence.append(job_id)
+            remaining[job_id] -= 1
 
-    for job_id, task_id in child:
-        if task_id in job_task_order[job_id] and task_id not in seen_tasks[job_id]:
-            fixed_child.append((job_id, task_id))
-            seen_tasks[job_id].append(task_id)
-
-    return fixed_child
+    return build_chromosome(job_sequence)
 
 
 def uniform_crossover(parent1, parent2):
@@ -0,0 +1,74 @@
+import random
+from chromosome import build_chromosome, create_interleaved_chromosome
+
+def population_diversity(population):
+    """
+    Cheap diversity measure: the fraction of distinct chromosomes in the population.
+    Returns 1.0 when every individual is unique and approaches 0.0 as copies take over.
+    """
+    if not population:
+        return 0.0
+    unique = {chromosome_key(ind) for ind in population}
+    return len(unique) / len(population)
+
+def chromosome_key(individual):
+    """
+    Hashable key identifying a chromosome's operation order.
+    """
+    return tuple((job_id, task_id) for job_id, task_id in individual)
+
+def heavy_mutation(individual, num_swaps=None):
+    """
+    Swap several random positions of the job sequence and reassign task ids,
+    so task precedence within each job is maintained.
+    By default about a tenth of the operations (at least two) are swapped.
+    """
+    job_sequence = [job_id for job_id, _ in individual]
+    if num_swaps is None:
+        num_swaps = max(2, len(job_sequence) // 10)
+
+    for _ in range(num_swaps):
+        i, j = random.sample(range(len(job_sequence)), 2)
+        job_sequence[i], job_sequence[j] = job_sequence[j], job_sequence[i]
+
+    return build_chromosome(job_sequence)
+
+def deduplicate_offspring(offspring, existing_keys, tasks, fresh_fraction=0.5, max_attempts=5):
+    """
+    Replace offspring that duplicate an existing individual or an earlier offspring.
+
+    Each duplicate is replaced in place, either by a fresh interleaved chromosome
+    (with probability `fresh_fraction`) or by a heavily mutated copy of itself,
+    until it is unique or `max_attempts` is reached. Replaced offspring lose
+    their fitness so they are re-evaluated.
+
+    Parameters:
+    - offspring (list): Individuals of the next generation, modified in place.
+    - existing_keys (iterable): chromosome_key of the individuals already kept (e.g. elites).
+    - tasks (list): All (job_id, task_id) operations of the instance.
+    - fresh_fraction (float): Probability of a fresh chromosome instead of a heavy mutation.
+    - max_attempts (int): Replacement attempts per duplicate.
+
+    Returns:
+    - replaced (list): The offspring that were replaced.
+    """
+    seen = set(existing_keys)
+    replaced = []
+
+    for ind in offspring:
+        key = chromosome_key(ind)
+        attempts = 0
+        while key in seen and attempts < max_attempts:
+            if random.random() < fresh_fraction:
+                ind[:] = create_interleaved_chromosome(tasks)
+            else:
+                ind[:] = heavy_mutation(ind)
+            key = chromosome_key(ind)
+            attempts += 1
+
+        if attempts:
+            del ind.fitness.values
+            replaced.append(ind)
+        seen.add(key)
+
+    return replaced
@@ -0,0 +1,118 @@
+import os
+from itertools import chain
+import numpy as np
+from multiprocessing import Pool, shared_memory
+from JSSP import evaluate, evaluate_bounded, remaining_work
+
+# Per-worker views on the shared buffers, set up once by _attach_worker
+_worker_state = {}
+
+def _attach_worker(population_name, fitness_name, capacity, num_operations, jobs_data):
+    """
+    Pool initializer: map the shared population and fitness blocks into this worker.
+    """
+    population_shm = shared_memory.SharedMemory(name=population_name)
+    fitness_shm = shared_memory.SharedMemory(name=fitness_name)
+    _worker_state.update(
+        population_shm=population_shm,
+        fitness_shm=fitness_shm,
+        # Flat int view: row r holds job_id, task_id pairs in [r * row_width, (r + 1) * row_width)
+        population=population_shm.buf.cast('i'),
+        row_width=num_operations * 2,
+        fitness=np.ndarray((capacity,), dtype=np.float64, buffer=fitness_shm.buf),
+        jobs_data=jobs_data,
+        bounds=remaining_work(jobs_data),
+    )
+
+def _evaluate_rows(task):
+    """
+    Evaluate population rows [start, stop) in place and write their makespans
+    into the shared fitness vector. Only the row range crosses the process boundary.
+    """
+    start, stop, cutoff = task
+    population = _worker_state["population"]
+    row_width = _worker_state["row_width"]
+    fitness = _worker_state["fitness"]
+    jobs_data = _worker_state["jobs_data"]
+
+    for row in range(start, stop):
+        # Decode straight from the shared block: pair up consecutive ints as (job_id, task_id)
+        values = iter(population[row * row_width:(row + 1) * row_width])
+        individual = zip(values, values)
+        if cutoff is None:
+            fitness[row] = evaluate(individual, jobs_data)[0]
+        else:
+            fitness[row] = evaluate_bounded(individual, jobs_data, cutoff, _worker_state["bounds"])[0]
+
+class SharedMemoryEvaluator:
+    """
+    Parallel makespan evaluation with the population copied into shared memory.
+
+    Each `evaluate` call copies the batch into a `multiprocessing.shared_memory`
+    block as fixed-width rows of (job_id, task_id) pairs, in one bulk write;
+    workers decode their row ranges in place and write the makespans into a
+    shared result vector, so no individual or fitness value is pickled. The
+    population itself stays a list of DEAP individuals between generations,
+    since the genetic operators work on those. Use as a context manager (or
+    call `close()`) to release the pool and the shared blocks.
+
+    Parameters:
+    - jobs_data (list): Parsed dataset, sent once to each worker.
+    - capacity (int): Number of rows in the shared population (usually the population size).
+      Larger batches are evaluated `capacity` rows at a time.
+    - processes (int): Number of worker processes (defaults to the CPU count).
+    - chunks_per_process (int): Row ranges handed to each worker per batch.
+    """
+
+    def __init__(self, jobs_data, capacity, processes=None, chunks_per_process=4):
+        self.capacity = capacity
+        self.num_operations = sum(len(job) for job in jobs_data)
+        self.processes = processes or os.cpu_count() or 1
+        self.num_chunks = self.processes * chunks_per_process
+
+        self.population_shm = shared_memory.SharedMemory(create=True, size=capacity * self.num_operations * 2 * 4)
+        self.fitness_shm = shared_memory.SharedMemory(create=True, size=capacity * 8)
+        self.population = np.ndarray((capacity, self.num_operations, 2), dtype=np.int32, buffer=self.population_shm.buf)
+        self.fitness = np.ndarray((capacity,), dtype=np.float64, buffer=self.fitness_shm.buf)
+
+        self.pool = Pool(
+            self.processes,
+            initializer=_attach_worker,
+            initargs=(self.population_shm.name, self.fitness_shm.name, capacity, self.num_operations, jobs_data),
+        )
+
+    def evaluate(self, individuals, cutoff=None):
+        """
+        Return the makespans of `individuals` in order.
+        With a `cutoff`, rows are decoded with `evaluate_bounded` and may come back as CUTOFF_EXCEEDED.
+        """
+        makespans = []
+        for offset in range(0, len(individuals), self.capacity):
+            batch = individuals[offset:offset + self.capacity]
+            count = len(batch) * self.num_operations * 2
+            self.population.reshape(-1)[:count] = np.fromiter(
+                chain.from_iterable(chain.from_iterable(batch)), dtype=np.int32, count=count)
+
+            # Split the batch into contiguous row ranges
+            step = max(1, -(-len(batch) // self.num_chunks))
+            ranges = [(start, min(start + step, len(batch)), cutoff) for start in range(0, len(batch), step)]
+            self.pool.map(_evaluate_rows, ranges)
+
+            makespans.extend(self.fitness[:len(batch)].tolist())
+        return makespans
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        # Drop the numpy views before releasing the buffers they point into
+        del self.population, self.fitness
+        self.population_shm.close()
+        self.population_shm.unlink()
+        self.fitness_shm.close()
+        self.fitness_shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
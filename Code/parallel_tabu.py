@@ -0,0 +1,101 @@
+import random
+from tabu_search import generate_neighborhood
+from parallel_eval import SharedMemoryEvaluator
+from JSSP import evaluate
+
+def parallel_tabu_search(start_solutions, jobs_data, processes=None, max_iter=100, tabu_tenure=5,
+                         neighborhood_size=10, share_interval=10, stagnation_limit=10):
+    """
+    Multi-start tabu search with parallel neighborhood evaluation.
+
+    One trajectory is started from each solution in `start_solutions` (e.g. the
+    elite GA individuals). Every iteration, the neighborhoods of all trajectories
+    are evaluated together in chunks on a `SharedMemoryEvaluator` worker pool, and
+    each trajectory then moves to its best admissible neighbor.
+    Every `share_interval` iterations the global best is shared: trajectories
+    without improvement for `stagnation_limit` iterations restart from a
+    neighbor of it with an empty tabu list.
+
+    Parameters:
+    - start_solutions (list): Starting chromosomes, one per trajectory.
+    - jobs_data (list): Parsed dataset.
+    - processes (int): Number of worker processes (defaults to the CPU count).
+    - max_iter (int): Number of iterations of every trajectory.
+    - tabu_tenure (int): Length of each trajectory's tabu list.
+    - neighborhood_size (int): Neighbors generated per trajectory and iteration.
+    - share_interval (int): Iterations between global best exchanges.
+    - stagnation_limit (int): Iterations without improvement before a trajectory is restarted.
+
+    Returns:
+    - best_solution (list): Best chromosome found by any trajectory.
+    - best_makespan (int): Its makespan.
+    """
+    trajectories = []
+    for solution in start_solutions:
+        solution = [(task[0], task[1]) for task in solution]  # Ensure job-task pair structure
+        makespan, _ = evaluate(solution, jobs_data)
+        trajectories.append({
+            "current": solution,
+            "best": solution,
+            "best_makespan": makespan,
+            "tabu_list": [],
+            "stagnation": 0,
+        })
+
+    leader = min(trajectories, key=lambda trajectory: trajectory["best_makespan"])
+    best_solution, best_makespan = leader["best"], leader["best_makespan"]
+
+    capacity = len(trajectories) * max(1, neighborhood_size)
+    with SharedMemoryEvaluator(jobs_data, capacity, processes=processes) as evaluator:
+        for iteration in range(max_iter):
+            # Evaluate the neighborhoods of all trajectories in one parallel batch
+            neighborhoods = [generate_neighborhood(trajectory["current"], neighborhood_size, jobs_data)
+                             for trajectory in trajectories]
+            makespans = evaluator.evaluate([neighbor for neighborhood in neighborhoods for neighbor in neighborhood])
+
+            offset = 0
+            for trajectory, neighborhood in zip(trajectories, neighborhoods):
+                neighbor_makespans = makespans[offset:offset + len(neighborhood)]
+                offset += len(neighborhood)
+
+                best_neighbor = None
+                best_neighbor_makespan = float('inf')
+                for neighbor, neighbor_makespan in zip(neighborhood, neighbor_makespans):
+                    # Aspiration criteria: a tabu neighbor is accepted only if it improves the trajectory best
+                    if neighbor_makespan < trajectory["best_makespan"] or neighbor not in trajectory["tabu_list"]:
+                        if neighbor_makespan < best_neighbor_makespan:
+                            best_neighbor = neighbor
+                            best_neighbor_makespan = neighbor_makespan
+
+                if best_neighbor is None:
+                    trajectory["stagnation"] += 1
+                    continue
+
+                trajectory["current"] = best_neighbor
+                if best_neighbor_makespan < trajectory["best_makespan"]:
+                    trajectory["best"] = best_neighbor
+                    trajectory["best_makespan"] = int(best_neighbor_makespan)
+                    trajectory["stagnation"] = 0
+                else:
+                    trajectory["stagnation"] += 1
+
+                trajectory["tabu_list"].append(best_neighbor)
+                if len(trajectory["tabu_list"]) > tabu_tenure:
+                    trajectory["tabu_list"].pop(0)
+
+            leader = min(trajectories, key=lambda trajectory: trajectory["best_makespan"])
+            if leader["best_makespan"] < best_makespan:
+                best_solution, best_makespan = leader["best"], leader["best_makespan"]
+
+            # Share the global best and restart stagnated trajectories from it
+            if (iteration + 1) % share_interval == 0:
+                for trajectory in trajectories:
+                    if trajectory["stagnation"] >= stagnation_limit:
+                        restart = random.choice(generate_neighborhood(best_solution, 1, jobs_data))
+                        trajectory["current"] = restart
+                        trajectory["tabu_list"] = []
+                        trajectory["stagnation"] = 0
+
+            print(f"Iteration {iteration + 1}/{max_iter}: Best Makespan = {best_makespan}")
+
+    return best_solution, best_makespan
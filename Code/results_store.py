@@ -0,0 +1,127 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    population_size INTEGER,
+    cxpb REAL,
+    mutpb REAL,
+    ngen INTEGER,
+    elitism_size INTEGER,
+    seed INTEGER,
+    makespan REAL,
+    runtime REAL,
+    fitness_evolution TEXT,
+    best_schedule TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_experiments_dataset ON experiments (dataset, algorithm, makespan);
+CREATE INDEX IF NOT EXISTS idx_experiments_parameters
+    ON experiments (dataset, population_size, cxpb, mutpb, ngen, elitism_size);
+CREATE INDEX IF NOT EXISTS idx_experiments_seed ON experiments (seed);
+"""
+
+# Summary columns returned by queries (curves and schedules are loaded with load_experiment)
+SUMMARY_COLUMNS = ("id", "created_at", "dataset", "algorithm", "population_size", "cxpb", "mutpb",
+                   "ngen", "elitism_size", "seed", "makespan", "runtime")
+PARAMETER_COLUMNS = ("population_size", "cxpb", "mutpb", "ngen", "elitism_size")
+
+class ResultsStore:
+    """
+    Append-only SQLite store of experiment results.
+
+    Every experiment is one row holding its parameters, seed, makespan, runtime,
+    convergence curve and best schedule, committed as soon as it is recorded so
+    nothing is lost if a run dies. The database runs in WAL mode: each process
+    (e.g. parallel workers) opens its own ResultsStore on the same file, and
+    concurrent writers wait on the busy timeout instead of failing.
+
+    Parameters:
+    - path (str): SQLite database file, created if it does not exist.
+    - timeout (float): Seconds to wait for a concurrent writer's lock.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def record_experiment(self, dataset, parameters, makespan, runtime, fitness_evolution=None,
+                          best_schedule=None, seed=None, algorithm="GA"):
+        """
+        Append one finished experiment and commit it. Returns the new experiment id.
+        `parameters` holds the run_ga arguments (population_size, cxpb, mutpb, ngen, elitism_size).
+        """
+        row = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "dataset": dataset,
+            "algorithm": algorithm,
+            "seed": seed,
+            "makespan": makespan,
+            "runtime": runtime,
+            "fitness_evolution": json.dumps(list(fitness_evolution)) if fitness_evolution is not None else None,
+            "best_schedule": json.dumps([list(task) for task in best_schedule]) if best_schedule is not None else None,
+        }
+        for column in PARAMETER_COLUMNS:
+            row[column] = parameters.get(column)
+        # run_ga's default elitism_size when the parameters leave it out
+        if row["elitism_size"] is None:
+            row["elitism_size"] = 1
+
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{column}" for column in row)
+        with self.connection:
+            cursor = self.connection.execute(f"INSERT INTO experiments ({columns}) VALUES ({placeholders})", row)
+        return cursor.lastrowid
+
+    def query(self, dataset=None, algorithm=None, seed=None, limit=None, **parameters):
+        """
+        Return experiment summaries as dicts, best makespan first.
+        Filters on dataset, algorithm, seed and any of the parameter columns.
+        """
+        filters = {"dataset": dataset, "algorithm": algorithm, "seed": seed}
+        for column, value in parameters.items():
+            if column not in PARAMETER_COLUMNS:
+                raise ValueError(f"Unknown parameter column: {column}")
+            filters[column] = value
+
+        conditions = [f"{column} = :{column}" for column, value in filters.items() if value is not None]
+        sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM experiments"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY makespan, id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        return [dict(row) for row in self.connection.execute(sql, filters)]
+
+    def load_experiment(self, experiment_id):
+        """
+        Return one experiment with its convergence curve and best schedule decoded, or None.
+        """
+        row = self.connection.execute("SELECT * FROM experiments WHERE id = ?", (experiment_id,)).fetchone()
+        if row is None:
+            return None
+        experiment = dict(row)
+        for column in ("fitness_evolution", "best_schedule"):
+            if experiment[column] is not None:
+                experiment[column] = json.loads(experiment[column])
+        if experiment["best_schedule"] is not None:
+            experiment["best_schedule"] = [tuple(task) for task in experiment["best_schedule"]]
+        return experiment
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,14 +1,26 @@
 import random
 import numpy as np
 from copy import deepcopy
-from JSSP import evaluate
+from JSSP import evaluate, evaluate_bounded, remaining_work
 
-def tabu_search(current_solution, jobs_data, evaluate, max_iter=100, tabu_tenure=5, neighborhood_size=10):
+def tabu_search(current_solution, jobs_data, evaluate, max_iter=100, tabu_tenure=5, neighborhood_size=10,
+                cutoff_evaluation=False):
+    """
+    Refine a solution with tabu search over precedence-preserving swaps.
+
+    With `cutoff_evaluation`, each neighbor is decoded with `evaluate_bounded`
+    and abandoned as soon as it cannot beat the best admissible neighbor found
+    so far in the iteration (or the best makespan, for tabu neighbors that can
+    only be accepted by aspiration).
+    """
     # Evaluate the current solution
     best_solution = deepcopy(current_solution)  # Best solution found
     best_solution = [(task[0], task[1]) for task in best_solution]  # Ensure job-task pair structure
     best_makespan, _ = evaluate(best_solution, jobs_data)
 
+    # Lower bounds for bounded evaluation, computed once per dataset
+    bounds = remaining_work(jobs_data) if cutoff_evaluation else None
+
     # Tabu list (used to store recent moves)
     tabu_list = []
 
@@ -24,7 +36,12 @@ def tabu_search(current_solution, jobs_data, evaluate, max_iter=100, tabu_tenure
 
         for neighbor in neighborhood:
             neighbor = [(task[0], task[1]) for task in neighbor]  # Ensure job-task pair structure
-            neighbor_makespan, _ = evaluate(neighbor, jobs_data)
+            if cutoff_evaluation:
+                # A tabu neighbor is only useful if it beats the best makespan (aspiration)
+                cutoff = min(best_neighbor_makespan, best_makespan) if neighbor in tabu_list else best_neighbor_makespan
+                neighbor_makespan, _ = evaluate_bounded(neighbor, jobs_data, cutoff, bounds)
+            else:
+                neighbor_makespan, _ = evaluate(neighbor, jobs_data)
 
             # If the neighbor is not in the Tabu list or it improves the solution, consider it
             if neighbor_makespan < best_makespan or (neighbor not in tabu_list):  # Aspiration criteria
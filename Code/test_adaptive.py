@@ -0,0 +1,65 @@
+import random
+from adaptive import AdaptiveOperatorController
+
+
+def _noop_crossover(parent1, parent2):
+    return parent1, parent2
+
+
+def _simulate(controller, success_rates, generations=40, children_per_generation=60):
+    for _ in range(generations):
+        for _ in range(children_per_generation):
+            name = controller.select_operator()
+            child_fitness = 90 if random.random() < success_rates[name] else 110
+            controller.record(name, 100, child_fitness)
+        controller.end_generation()
+
+
+def test_better_operator_gets_higher_probability():
+    random.seed(0)
+    controller = AdaptiveOperatorController({"good": _noop_crossover, "bad": _noop_crossover})
+    _simulate(controller, {"good": 0.10, "bad": 0.03})
+
+    assert controller.probabilities["good"] > controller.probabilities["bad"]
+    assert controller.probabilities["good"] > 0.8
+
+
+def test_better_operator_wins_regardless_of_dict_order():
+    random.seed(1)
+    controller = AdaptiveOperatorController({"bad": _noop_crossover, "good": _noop_crossover})
+    _simulate(controller, {"good": 0.10, "bad": 0.03})
+
+    assert controller.probabilities["good"] > 0.8
+
+
+def test_probabilities_unchanged_without_successes():
+    random.seed(2)
+    controller = AdaptiveOperatorController({"a": _noop_crossover, "b": _noop_crossover})
+    _simulate(controller, {"a": 0.0, "b": 0.0}, generations=5)
+
+    assert controller.probabilities == {"a": 0.5, "b": 0.5}
+
+
+def test_mutation_rate_starts_from_default_and_rises_as_diversity_falls():
+    controller = AdaptiveOperatorController({"a": _noop_crossover}, max_mutpb=0.5)
+    controller.set_default_mutation_rate(0.2)
+
+    assert controller.update_mutation_rate(1.0) == 0.2
+    assert controller.update_mutation_rate(0.0) == 0.5
+
+
+def test_explicit_base_mutation_rate_is_kept():
+    controller = AdaptiveOperatorController({"a": _noop_crossover}, base_mutpb=0.05)
+    controller.set_default_mutation_rate(0.2)
+
+    assert controller.update_mutation_rate(1.0) == 0.05
+
+
+def test_cut_off_child_counts_as_failure_and_cut_off_parent_is_ignored():
+    controller = AdaptiveOperatorController({"a": _noop_crossover})
+    controller.record("a", 100, float('inf'))
+    controller.record("a", float('inf'), 90)
+
+    stats = controller.statistics()["a"]
+    assert stats["applications"] == 1
+    assert stats["successes"] == 0
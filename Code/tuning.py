@@ -0,0 +1,125 @@
+import itertools
+import random
+import time
+import os
+import csv
+from JSSP import run_ga
+
+# Candidate values for each tuned GA parameter
+PARAMETER_SPACE = {
+    "population_size": [50, 100, 150, 200],
+    "cxpb": [0.6, 0.7, 0.8, 0.9],
+    "mutpb": [0.05, 0.1, 0.2, 0.3],
+    "elitism_size": [1, 2, 5],
+}
+
+def sample_configurations(num_configurations, space=PARAMETER_SPACE):
+    """
+    Draw distinct parameter configurations from the parameter space.
+    Returns the full grid if it holds fewer than `num_configurations` points.
+    """
+    names = list(space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+    if num_configurations >= len(grid):
+        return grid
+    return random.sample(grid, num_configurations)
+
+def successive_halving(file_path, configurations, min_generations=10, max_generations=150, eta=3):
+    """
+    Race parameter configurations with successive halving.
+
+    Every configuration is run for `min_generations`; the best 1/`eta` of them
+    are kept and re-run with `eta` times the generation budget, until one
+    configuration is left or the budget reaches `max_generations`.
+
+    Parameters:
+    - file_path (str): Dataset file passed to run_ga.
+    - configurations (list): Dicts of run_ga keyword arguments (without `ngen`).
+    - min_generations (int): Generation budget of the first rung.
+    - max_generations (int): Maximum generation budget of any rung.
+    - eta (int): Reduction factor between rungs (must be at least 2).
+
+    Returns:
+    - ranking (list): One dict per configuration with its parameters, the last
+      budget it reached, its makespan and runtime at that budget and its rank.
+      Configurations that reached a larger budget rank first, then lower makespan.
+    """
+    if eta < 2:
+        raise ValueError("eta must be at least 2.")
+
+    results = [{"parameters": dict(config)} for config in configurations]
+    survivors = list(range(len(results)))
+    budget = min(min_generations, max_generations)
+
+    while survivors:
+        print(f"Successive halving: {len(survivors)} configurations with {budget} generations")
+        for index in survivors:
+            start_time = time.time()
+            _, makespan, _ = run_ga(file_path, ngen=budget, plot=False, **results[index]["parameters"])
+            results[index].update(ngen=budget, makespan=makespan, runtime=time.time() - start_time)
+
+        if len(survivors) == 1 or budget >= max_generations:
+            break
+
+        # Keep the best fraction and give the survivors more generations
+        survivors.sort(key=lambda index: results[index]["makespan"])
+        survivors = survivors[:max(1, len(survivors) // eta)]
+        budget = min(budget * eta, max_generations)
+
+    ranking = sorted(results, key=lambda result: (-result["ngen"], result["makespan"]))
+    for rank, result in enumerate(ranking, start=1):
+        result["rank"] = rank
+    return ranking
+
+def print_ranking(ranking):
+    """
+    Print the ranked configurations as a table.
+    """
+    print(f"{'Rank':>4} {'Pop':>5} {'Cxpb':>5} {'Mutpb':>6} {'Elite':>5} {'Ngen':>5} {'Makespan':>9} {'Runtime':>8}")
+    for result in ranking:
+        param = result["parameters"]
+        print(f"{result['rank']:>4} {param['population_size']:>5} {param['cxpb']:>5} {param['mutpb']:>6} "
+              f"{param['elitism_size']:>5} {result['ngen']:>5} {result['makespan']:>9} {result['runtime']:>8.2f}")
+
+def save_ranking_to_csv(ranking, filename="tuning_results.csv"):
+    # Specify the full path where you want to save the file
+    folder_path = r"C:\Users\Arif Bhuiyan\Desktop\A2\Result"
+
+    # Create the folder if it doesn't exist
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+
+    file_path = os.path.join(folder_path, filename)
+
+    with open(file_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Rank", "Population Size", "Crossover Probability", "Mutation Probability",
+                         "Elitism Size", "Generations", "Makespan", "Runtime"])
+        for result in ranking:
+            param = result["parameters"]
+            writer.writerow([result["rank"], param["population_size"], param["cxpb"], param["mutpb"],
+                             param["elitism_size"], result["ngen"], result["makespan"], result["runtime"]])
+
+def main():
+    datasets = {
+        "fisher_thompson_6x6": r"C:\Users\Arif Bhuiyan\Desktop\A2\fisher_thompson_6x6.txt",
+        "fisher_thompson_10x10": r"C:\Users\Arif Bhuiyan\Desktop\A2\fisher_thompson_10x10.txt",
+        "adams_balas_and_zawack_15x20": r"C:\Users\Arif Bhuiyan\Desktop\A2\adams_balas_and_zawack_15x20.txt",
+    }
+
+    # Select dataset
+    dataset_name = input(f"Select dataset {list(datasets.keys())}: ")
+    if dataset_name not in datasets:
+        print("Invalid dataset name!")
+        return
+
+    # 27 candidates with eta=3 give rungs of 27, 9, 3 and 1 configurations
+    configurations = sample_configurations(27)
+    ranking = successive_halving(datasets[dataset_name], configurations, min_generations=10, max_generations=150, eta=3)
+
+    print_ranking(ranking)
+    save_ranking_to_csv(ranking, f"tuning_results_{dataset_name}.csv")
+
+
+if __name__ == "__main__":
+    main()